@@ -3,25 +3,20 @@ import re
 import subprocess
 import time
 import requests
-from github import Github
+
+DIFF_PATTERN = re.compile(r'```(?:diff|typescript|python|gradle)?\s*(.*?)\s*```', re.DOTALL)
 
 def extract_diffs(suggestion_text):
-    diff_pattern = re.compile(r'```(?:diff|typescript|python|gradle)?\s*(.*?)\s*```', re.DOTALL)
-    diffs = diff_pattern.findall(suggestion_text)
-    return [diff.strip() for diff in diffs if diff.strip()]
+    diffs = (match.group(1).strip() for match in DIFF_PATTERN.finditer(suggestion_text))
+    return [diff for diff in diffs if diff]
 
 def apply_diffs(diffs, repo_path):
-    os.chdir(repo_path)
-    for i, diff in enumerate(diffs):
-        patch_file = f'temp_patch_{i}.patch'
-        with open(patch_file, 'w') as f:
-            f.write(diff)
-        try:
-            subprocess.run(['git', 'apply', '--reject', '--whitespace=fix', patch_file], check=True)
-            os.remove(patch_file)
-        except subprocess.CalledProcessError as e:
-            print(f"Patch {i} failed: {e}")
-            raise
+    combined = ''.join(diff + '\n' for diff in diffs)
+    try:
+        subprocess.run(['git', '-C', repo_path, 'apply', '--reject', '--whitespace=fix', '-'], input=combined.encode(), check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Applying {len(diffs)} patch(es) failed: {e}")
+        raise
 
 def create_branch_and_commit(branch_name):
     subprocess.run(['git', 'checkout', '-b', branch_name], check=True)
@@ -33,10 +28,14 @@ def push_branch(branch_name, remote='origin'):
 
 def create_pr(repo_owner, repo_name, branch_name, base_branch='main', title='Milla Automated Updates', body='Applied suggestions: offline Gemma, voice, orb, etc.'):
     token = os.getenv('GITHUB_TOKEN')
-    g = Github(token)
-    repo = g.get_repo(f"{repo_owner}/{repo_name}")
-    pr = repo.create_pull(title=title, body=body, head=branch_name, base=base_branch)
-    return pr.html_url
+    response = requests.post(
+        f"https://api.github.com/repos/{repo_owner}/{repo_name}/pulls",
+        headers={'Authorization': f"Bearer {token}", 'Accept': 'application/vnd.github+json'},
+        json={'title': title, 'body': body, 'head': branch_name, 'base': base_branch},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()['html_url']
 
 suggestion_text = """### Daily Update on Milla-Rayne App Enhancements
 
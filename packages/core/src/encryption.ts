@@ -29,15 +29,13 @@ export class MillaEncryption {
     const iv = randomBytes(this.ivLength);
     
     const cipher = createCipheriv(this.algorithm, key, iv);
-    const encrypted = Buffer.concat([
-      cipher.update(data, 'utf8'),
-      cipher.final()
-    ]);
-    
+    const body = cipher.update(data, 'utf8');
+    const final = cipher.final();
+
     const tag = cipher.getAuthTag();
-    
-    // Combine salt + iv + tag + encrypted data
-    const combined = Buffer.concat([salt, iv, tag, encrypted]);
+
+    // Combine salt + iv + tag + encrypted data in a single copy
+    const combined = Buffer.concat([salt, iv, tag, body, final]);
     return combined.toString('base64');
   }
 